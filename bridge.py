@@ -1,6 +1,7 @@
 """Modular configuration system for LightX2V ComfyUI integration."""
 
 import copy
+import functools
 import importlib.util
 import json
 import logging
@@ -19,6 +20,7 @@ def is_fp8_supported_gpu():
     return (major == 8 and minor == 9) or (major >= 9)
 
 
+@functools.lru_cache(maxsize=None)
 def is_module_installed(module_name):
     try:
         spec = importlib.util.find_spec(module_name)
@@ -122,6 +124,7 @@ class LightX2VDefaultConfig:
         "clip_quant_scheme": "fp16",
         "quant_op": "vllm",
         "precision_mode": "fp32",
+        "enable_tf32": False,
         "dit_quantized_ckpt": None,
         "t5_quantized_ckpt": None,
         "clip_quantized_ckpt": None,
@@ -422,6 +425,7 @@ class ModularConfigManager:
             updates["mm_config"] = {"mm_type": "Default"}
 
         updates["precision_mode"] = config.get("sensitive_layers_precision", "fp32")
+        updates["enable_tf32"] = config.get("enable_tf32", False)
 
         return updates
 
@@ -439,6 +443,9 @@ class ModularConfigManager:
         if config.get("clean_cuda_cache", False) or level == "extreme":
             updates["clean_cuda_cache"] = True
 
+        if config.get("enable_graph_mode", False):
+            updates["torch_compile"] = True
+
         # CPU offloading
         if config.get("enable_cpu_offload", False) or level in [
             "medium",
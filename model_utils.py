@@ -1,6 +1,7 @@
 # coding: utf-8
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, List
 
@@ -10,7 +11,7 @@ import folder_paths
 def get_model_base_path() -> Path:
     models_base = folder_paths.models_dir
     lightx2v_path = Path(models_base) / "lightx2v"
-    if not lightx2v_path.exists():
+    if not os.path.isdir(lightx2v_path):
         lightx2v_path.mkdir(parents=True, exist_ok=True)
     return lightx2v_path
 
@@ -19,10 +20,11 @@ def scan_models() -> List[str]:
     models = []
     base_path = get_model_base_path()
 
-    if base_path.exists():
-        for item in base_path.iterdir():
-            if item.is_dir() and item.name != "loras":
-                models.append(item.name)
+    if os.path.isdir(base_path):
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name != "loras":
+                    models.append(entry.name)
 
     models.sort()
 
@@ -34,11 +36,12 @@ def scan_loras() -> List[str]:
     base_path = get_model_base_path()
     loras_path = base_path / "loras"
 
-    if loras_path.exists():
-        for item in loras_path.iterdir():
-            if item.is_file():
-                if item.suffix.lower() in [".safetensors", ".pt", ".pth", ".ckpt"]:
-                    loras.append(item.name)
+    if os.path.isdir(loras_path):
+        with os.scandir(loras_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if os.path.splitext(entry.name)[1].lower() in [".safetensors", ".pt", ".pth", ".ckpt"]:
+                        loras.append(entry.name)
 
     loras.sort()
 
@@ -52,7 +55,7 @@ def get_model_full_path(model_name: str) -> str:
     base_path = get_model_base_path()
     model_path = base_path / model_name
 
-    if model_path.exists():
+    if os.path.isdir(model_path):
         return str(model_path)
     return ""
 
@@ -64,7 +67,7 @@ def get_lora_full_path(lora_name: str) -> str:
     base_path = get_model_base_path()
     lora_path = base_path / "loras" / lora_name
 
-    if lora_path.exists():
+    if os.path.isfile(lora_path):
         return str(lora_path)
     return ""
 
@@ -76,7 +79,8 @@ def get_model_info(model_name: str) -> Dict:
     base_path = get_model_base_path()
     config_path = base_path / model_name / "config.json"
 
-    if config_path.exists():
+    try:
         with open(config_path, "r") as f:
             return json.load(f)
-    return {}
+    except FileNotFoundError:
+        return {}
@@ -5,6 +5,7 @@ import hashlib
 import json
 import logging
 import os
+import random
 import tempfile
 
 import numpy as np
@@ -17,7 +18,6 @@ from .bridge import (
     get_available_attn_ops,
     get_available_quant_ops,
 )
-from .lightx2v.lightx2v.infer import init_runner
 from .model_utils import (
     get_lora_full_path,
     get_model_full_path,
@@ -173,7 +173,7 @@ class LightX2VInferenceConfig:
             "model_path": model_path,
             "task": task,
             "infer_steps": infer_steps,
-            "seed": seed if seed != -1 else np.random.randint(0, 2**32 - 1),
+            "seed": seed if seed != -1 else random.randint(0, 2**32 - 2),
             "cfg_scale": cfg_scale,
             "sample_shift": sample_shift,
             "height": height,
@@ -285,7 +285,16 @@ class LightX2VQuantization:
                         "tooltip": "Sensitive layers (normalization and embedding) precision",
                     },
                 ),
-            }
+            },
+            "optional": {
+                "enable_tf32": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Use TF32 matmuls and cuDNN autotuning during inference, faster on Ampere+ but fp32 layers lose precision",
+                    },
+                ),
+            },
         }
 
     RETURN_TYPES = ("QUANT_CONFIG",)
@@ -300,6 +309,7 @@ class LightX2VQuantization:
         clip_precision,
         quant_backend,
         sensitive_layers_precision,
+        enable_tf32=False,
     ):
         """Create quantization configuration."""
         config = {
@@ -308,6 +318,7 @@ class LightX2VQuantization:
             "clip_precision": clip_precision,
             "quant_backend": quant_backend,
             "sensitive_layers_precision": sensitive_layers_precision,
+            "enable_tf32": enable_tf32,
         }
         return (config,)
 
@@ -377,6 +388,14 @@ class LightX2VMemoryOptimization:
                     "BOOLEAN",
                     {"default": False, "tooltip": "Unload modules after inference"},
                 ),
+                # Compilation
+                "enable_graph_mode": (
+                    "BOOLEAN",
+                    {
+                        "default": False,
+                        "tooltip": "Compile the model with torch.compile, only takes effect on the first run after ComfyUI starts",
+                    },
+                ),
             },
         }
 
@@ -397,6 +416,7 @@ class LightX2VMemoryOptimization:
         offload_ratio=1.0,
         lazy_load=False,
         unload_after_inference=False,
+        enable_graph_mode=False,
     ):
         config = {
             "optimization_level": optimization_level,
@@ -409,6 +429,7 @@ class LightX2VMemoryOptimization:
             "offload_ratio": offload_ratio,
             "lazy_load": lazy_load,
             "unload_after_inference": unload_after_inference,
+            "enable_graph_mode": enable_graph_mode,
         }
         return (config,)
 
@@ -629,10 +650,11 @@ class LightX2VModularInference:
         os.environ["TOKENIZERS_PARALLELISM"] = "false"
         if "DTYPE" not in os.environ:
             os.environ["DTYPE"] = "BF16"
+        # lightx2v reads this once when it is first imported, so later toggles need a restart
         if "ENABLE_GRAPH_MODE" not in os.environ:
-            os.environ["ENABLE_GRAPH_MODE"] = "false"
+            os.environ["ENABLE_GRAPH_MODE"] = "true" if getattr(combined_config, "torch_compile", False) else "false"
         if "ENABLE_PROFILING_DEBUG" not in os.environ:
-            os.environ["ENABLE_PROFILING_DEBUG"] = "true"
+            os.environ["ENABLE_PROFILING_DEBUG"] = "false"
 
         config = combined_config
 
@@ -711,6 +733,9 @@ class LightX2VModularInference:
                     torch.cuda.empty_cache()
                     gc.collect()
 
+                # Imported lazily so ComfyUI startup does not pull in the whole lightx2v stack
+                from .lightx2v.lightx2v.infer import init_runner
+
                 self._current_runner = init_runner(config)
                 self._current_config_hash = config_hash
             else:
@@ -726,15 +751,35 @@ class LightX2VModularInference:
             if hasattr(self._current_runner, "set_progress_callback"):
                 self._current_runner.set_progress_callback(update_progress)
 
-            images, audio = self._current_runner.run_pipeline(save_video=False)
-
-            if getattr(config, "unload_after_inference", False):
+            # Opt-in TF32/cuDNN autotuning, restoring the process-wide flags afterwards
+            prev_backend_flags = None
+            if getattr(config, "enable_tf32", False):
+                prev_backend_flags = (
+                    torch.backends.cuda.matmul.allow_tf32,
+                    torch.backends.cudnn.allow_tf32,
+                    torch.backends.cudnn.benchmark,
+                )
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+                torch.backends.cudnn.benchmark = True
+            try:
+                images, audio = self._current_runner.run_pipeline(save_video=False)
+            finally:
+                if prev_backend_flags is not None:
+                    (
+                        torch.backends.cuda.matmul.allow_tf32,
+                        torch.backends.cudnn.allow_tf32,
+                        torch.backends.cudnn.benchmark,
+                    ) = prev_backend_flags
+
+            if getattr(config, "unload_modules", False):
                 del self._current_runner
                 self._current_runner = None
                 self._current_config_hash = None
 
-            torch.cuda.empty_cache()
-            gc.collect()
+            if getattr(config, "unload_modules", False) or getattr(config, "clean_cuda_cache", False):
+                torch.cuda.empty_cache()
+                gc.collect()
 
             return (images, audio)
 